@@ -5,12 +5,15 @@ ObsDD is a package for generating a description of the variables and their stati
 
 """
 
-import pandas as pd
-
 from obsdd.get_common_summary_stats import get_common_summary_stats
 from obsdd.get_stats_for_list_type_var import get_stats_for_list_type_var
 from obsdd.get_stats_for_numeric_type_var import get_stats_for_numeric_type_var
 from obsdd.make_lu_obs_df_for_var import make_lu_obs_df_for_var
+from obsdd.make_obs_dd_incremental import (
+    make_accumulator_for_series,
+    make_obs_dd_from_accumulators,
+    make_obs_dd_incremental
+)
 
 def make_obs_dd(df):
     """
@@ -25,48 +28,12 @@ def make_obs_dd(df):
 
     """
 
-    obs_dd_records = []
-    lu_obs_dfs = []
-
-    col_names = list(df.columns)
-
-    # Loop over all columns in the input DataFrame
-    for col_name in col_names:
-
-        series = df[col_name]
-
-        summary_stats = {}
-        summary_stats['var_name'] = col_name
-
-        common_summary_stats = get_common_summary_stats(series)
-        summary_stats.update(common_summary_stats)
-
-        observed_data_type = summary_stats['observed_data_type']
-
-        if observed_data_type in ['NumberList', 'StringList']:
-            stats_for_list_type_var = get_stats_for_list_type_var(series, observed_data_type)
-            summary_stats.update(stats_for_list_type_var)
-
-            # Make Look-Up (LU) Observations for variable
-            lu_obs_for_var = make_lu_obs_df_for_var(series)
-            lu_obs_dfs.append(lu_obs_for_var)
-
-
-        if observed_data_type in ['Integer', 'Decimal']:
-            stats_for_numeric_var = get_stats_for_numeric_type_var(series)
-            summary_stats.update(stats_for_numeric_var)
-            
-        obs_dd_records.append(summary_stats)
+    # Summarize every column in a single pass and build the ObsDD from the summaries
+    accumulators = {}
 
-    # Combine all ObsDD records into a single DataFrame
-    obs_dd = pd.DataFrame(obs_dd_records)
+    for col_name in list(df.columns):
+        accumulators[col_name] = make_accumulator_for_series(df[col_name])
 
-    # Combine all Look-Up (LU) Observations into a single DataFrame
-    if len(lu_obs_dfs) > 0:
-      lu_obs = pd.concat(lu_obs_dfs)
-      lu_obs = lu_obs.reset_index(drop = True)
-    
-    else:
-      lu_obs = pd.DataFrame()
+    obs_dd, lu_obs = make_obs_dd_from_accumulators(accumulators)
 
     return obs_dd, lu_obs
@@ -21,14 +21,63 @@ def get_common_summary_stats(series):
 
     Notes
     -----
-    This function uses several helper functions to compute summary statistics for
-    a pandas Series. The helper functions are documented separately.
+    The statistics other than the observed data type are computed from the value
+    counts of the Series by get_common_summary_stats_from_counts.
     """
-    number_of_observed_values = get_number_of_observed_values(series)
-    number_of_distinct_values = get_number_of_distinct_values(series)
-    string_of_missing_stats = get_string_of_missing_stats(series)
+    value_counts = get_observed_value_counts(series)
     observed_data_type = get_observed_data_type(series)
- 
+
+    return get_common_summary_stats_from_counts(value_counts, series.shape[0], observed_data_type)
+
+
+def get_observed_value_counts(series):
+    """
+    Get the number of times each non-missing value occurs in a pandas Series.
+
+    Parameters
+    ----------
+    series : pandas.Series
+        A pandas Series to count values in.
+
+    Returns
+    -------
+    pandas.Series
+        The count of each value that occurs in the Series, indexed by value in
+        order of first appearance.
+
+    Notes
+    -----
+    Declared categories of a categorical Series that never occur are dropped,
+    so that the counts only describe the observed values, as series.unique() does.
+    """
+    value_counts = series.value_counts(sort = False, dropna = True)
+    value_counts = value_counts[value_counts > 0]
+
+    return value_counts
+
+
+def get_common_summary_stats_from_counts(value_counts, number_of_rows, observed_data_type):
+    """
+    Get a dictionary of common summary statistics from the value counts of a variable.
+
+    Parameters
+    ----------
+    value_counts : pandas.Series
+        The counts of each non-missing value of the variable, indexed by value.
+    number_of_rows : int
+        The total number of rows, including missing values.
+    observed_data_type : str
+        The observed data type of the variable.
+
+    Returns
+    -------
+    dict
+        A dictionary with the same keys and values as get_common_summary_stats.
+    """
+    number_of_observed_values = get_number_of_observed_values_from_counts(value_counts)
+    number_of_distinct_values = get_number_of_distinct_values_from_counts(value_counts, number_of_rows)
+    string_of_missing_stats = get_string_of_missing_stats_from_counts(value_counts, number_of_rows)
+
     common_summary_stats = {}
     common_summary_stats['number_of_observed_values'] = number_of_observed_values
     common_summary_stats['number_of_distinct_values'] = number_of_distinct_values
@@ -52,7 +101,26 @@ def get_number_of_observed_values(series):
     int
         The number of non-missing values in the Series.
     """
-    number_of_observed_values = series.dropna().shape[0]
+    value_counts = get_observed_value_counts(series)
+
+    return get_number_of_observed_values_from_counts(value_counts)
+
+
+def get_number_of_observed_values_from_counts(value_counts):
+    """
+    Get the number of non-missing values from the value counts of a variable.
+
+    Parameters
+    ----------
+    value_counts : pandas.Series
+        The counts of each non-missing value of the variable, indexed by value.
+
+    Returns
+    -------
+    int
+        The number of non-missing values.
+    """
+    number_of_observed_values = int(value_counts.sum())
     return number_of_observed_values
 
 
@@ -70,7 +138,30 @@ def get_number_of_distinct_values(series):
     int
         The number of distinct values in the Series.
     """
-    number_of_distinct_values = len(list(series.unique()))
+    value_counts = get_observed_value_counts(series)
+
+    return get_number_of_distinct_values_from_counts(value_counts, series.shape[0])
+
+
+def get_number_of_distinct_values_from_counts(value_counts, number_of_rows):
+    """
+    Get the number of distinct values from the value counts of a variable.
+
+    Parameters
+    ----------
+    value_counts : pandas.Series
+        The counts of each non-missing value of the variable, indexed by value.
+    number_of_rows : int
+        The total number of rows, including missing values.
+
+    Returns
+    -------
+    int
+        The number of distinct values, counting missing values as one value
+        as series.unique() does.
+    """
+    num_missing = number_of_rows - get_number_of_observed_values_from_counts(value_counts)
+    number_of_distinct_values = value_counts.shape[0] + (1 if num_missing > 0 else 0)
     return number_of_distinct_values
 
 
@@ -88,8 +179,29 @@ def get_string_of_missing_stats(series):
     str
         A string describing the number and percentage of missing values in the Series.
     """
-    num_missing = series[series.isna()].shape[0]
-    prop_missing = num_missing / series.shape[0]
+    value_counts = get_observed_value_counts(series)
+
+    return get_string_of_missing_stats_from_counts(value_counts, series.shape[0])
+
+
+def get_string_of_missing_stats_from_counts(value_counts, number_of_rows):
+    """
+    Get a string describing the number and percentage of missing values from the value counts of a variable.
+
+    Parameters
+    ----------
+    value_counts : pandas.Series
+        The counts of each non-missing value of the variable, indexed by value.
+    number_of_rows : int
+        The total number of rows, including missing values.
+
+    Returns
+    -------
+    str
+        A string describing the number and percentage of missing values.
+    """
+    num_missing = number_of_rows - get_number_of_observed_values_from_counts(value_counts)
+    prop_missing = num_missing / number_of_rows
     pct_missing = f'{round(100 * prop_missing, 2)}%'
     string_of_missing_stats = f'{num_missing} ({pct_missing})'
     return string_of_missing_stats
@@ -1,9 +1,14 @@
+import pandas as pd
+
 from obsdd.date_helpers import (
     string_series_is_series_of_blsa_dates,
     string_series_is_series_of_extended_blsa_dates,
     string_series_is_series_of_td_dates
 )
 
+# Maximum number of unique values for a variable to be treated as a list type
+SMALL_NUMBER = 15
+
 def get_observed_data_type(series):
     """
     Infer the data type of a pandas Series based on its contents.
@@ -34,19 +39,57 @@ def get_observed_data_type(series):
        number of unique values, return "StringList".
     6. If none of the above conditions hold, return "String".
     """
-    if classified_as_datetime_by_pandas(series):
+    return classify_observed_data_type(
+        dtype=str(series.dtype),
+        values_are_dates=appears_to_be_date(series),
+        all_integers=every_value_is_an_integer(series),
+        number_of_unique_values=len(list(series.unique()))
+    )
+
+
+def classify_observed_data_type(dtype, values_are_dates, all_integers, number_of_unique_values):
+    """
+    Apply the heuristics of get_observed_data_type to precomputed properties of a Series.
+
+    Parameters
+    ----------
+    dtype : str
+        The pandas dtype of the Series, as a string (e.g. 'int64').
+    values_are_dates : bool
+        Whether every non-missing value matches a recognized date format.
+    all_integers : bool
+        Whether every non-missing value is an integer.
+    number_of_unique_values : int
+        The number of unique values in the Series, counting missing as one value.
+
+    Returns
+    -------
+    str
+        A string representing the inferred data type of the Series.
+
+    Notes
+    -----
+    This lets make_obs_dd_incremental reclassify a column from accumulated
+    properties without rescanning it, e.g. when new values push a NumberList
+    past the list-type cardinality threshold.
+    """
+    is_numeric = dtype in ['int64', 'float64']
+    is_object = dtype == "object"
+    is_small_number = number_of_unique_values <= SMALL_NUMBER
+
+    if dtype == "datetime64":
         return "DateTime"
 
-    elif classified_as_object_by_pandas(series) and appears_to_be_date(series):
+    elif is_object and values_are_dates:
         return "DateTime"
 
-    elif classified_as_numeric_by_pandas(series) and every_value_is_an_integer(series) and has_small_number_of_unique_values(series):
+    elif is_numeric and all_integers and is_small_number:
         return "NumberList"
 
-    elif classified_as_numeric_by_pandas(series) and not every_value_is_an_integer(series):
+    elif is_numeric and not all_integers:
         return "Decimal"
 
-    elif classified_as_object_by_pandas(series) and has_small_number_of_unique_values(series):
+    elif is_object and is_small_number:
         return "StringList"
 
     else:
@@ -118,7 +161,6 @@ def has_small_number_of_unique_values(series):
     bool
         True if the Series has 15 or fewer unique values, False otherwise.
     """
-    SMALL_NUMBER = 15
     num_unique_vales = len(list(series.unique()))
     return num_unique_vales <= SMALL_NUMBER
 
@@ -180,14 +222,17 @@ def every_value_is_an_integer(series):
     the "int" version of each value to its "decimal" form. If the "int" version
     of each value is the same as the "decimal" form, then the value is an
     integer. This method works even if the Series contains missing values.
+    Only the distinct values are checked, so the cost grows with the number of
+    unique values rather than the number of rows.
     """
     if not classified_as_numeric_by_pandas(series):
         return False
 
     all_integers = False
 
-    temp_1 = series.dropna().apply(lambda x: int(x))
-    temp_2 = series.dropna()
+    # Whether a value is an integer only depends on the distinct values
+    temp_2 = pd.Series(series.dropna().unique())
+    temp_1 = temp_2.apply(lambda x: int(x))
 
     difference = temp_1 - temp_2
     
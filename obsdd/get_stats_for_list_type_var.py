@@ -1,18 +1,41 @@
+import pandas as pd
+
+from obsdd.get_common_summary_stats import get_observed_value_counts
+
+
 def get_stats_for_list_type_var(series, observed_data_type):
     """
     Computes statistics for a series column of type 'NumberList' or 'StringList'
-    
+
     Parameters:
         series (pandas.Series): The series column to compute statistics for
         observed_data_type (str): The observed data type of the series column
-    
+
     Returns:
         dict: A dictionary containing statistics for the series column
     """
-    
-    permissible_values = get_permissible_values(series, observed_data_type)
-    pv_pcts = get_pv_pcts(series, observed_data_type)
-    
+
+    value_counts = get_observed_value_counts(series)
+
+    return get_stats_for_list_type_var_from_counts(value_counts, observed_data_type)
+
+
+def get_stats_for_list_type_var_from_counts(value_counts, observed_data_type):
+    """
+    Computes statistics for a 'NumberList' or 'StringList' variable from its value counts
+
+    Parameters:
+        value_counts (pandas.Series): The counts of each non-missing value, indexed by value
+            in order of first appearance
+        observed_data_type (str): The observed data type of the variable
+
+    Returns:
+        dict: A dictionary containing statistics for the variable
+    """
+
+    permissible_values = get_permissible_values_from_counts(value_counts, observed_data_type)
+    pv_pcts = get_pv_pcts_from_counts(value_counts, observed_data_type)
+
     stats_for_list_type_var = {}
     stats_for_list_type_var['permissible_values'] = permissible_values
     stats_for_list_type_var['pv_pcts'] = pv_pcts
@@ -23,47 +46,85 @@ def get_stats_for_list_type_var(series, observed_data_type):
 def get_permissible_values(series, observed_data_type):
     """
     Computes the permissible values for a series column of type 'NumberList' or 'StringList'
-    
+
     Parameters:
         series (pandas.Series): The series column to compute permissible values for
         observed_data_type (str): The observed data type of the series column
-    
+
     Returns:
         list: A list of permissible values for the series column
     """
 
-    permissible_values = list(series.dropna().unique())
+    value_counts = get_observed_value_counts(series)
+
+    return get_permissible_values_from_counts(value_counts, observed_data_type)
+
+
+def get_permissible_values_from_counts(value_counts, observed_data_type):
+    """
+    Computes the permissible values for a 'NumberList' or 'StringList' variable from its value counts
+
+    Parameters:
+        value_counts (pandas.Series): The counts of each non-missing value, indexed by value
+            in order of first appearance
+        observed_data_type (str): The observed data type of the variable
+
+    Returns:
+        list: A list of permissible values for the variable
+    """
+
+    permissible_values = list(value_counts.index)
 
     if observed_data_type == "NumberList":
         permissible_values = [int(pv) for pv in permissible_values]
         permissible_values.sort()
-        
+
     return permissible_values
 
 
 def get_pv_pcts(series, observed_data_type):
     """
     Computes the percentages of each permissible value for a series column of type 'NumberList' or 'StringList'
-    
+
     Parameters:
         series (pandas.Series): The series column to compute permissible value percentages for
         observed_data_type (str): The observed data type of the series column
-    
+
     Returns:
         str: A string representation of a list of dictionaries containing permissible value percentages
     """
 
-    no_missing = series.dropna()
-    length = no_missing.shape[0]
-    props = no_missing.value_counts() / length
-    pcts = props.apply(lambda x: f'{round(100 * x , 2)}%')
-    
-    pcts = pcts.reset_index()
-    pcts = pcts.rename(columns = {"index" : "value", series.name : "pct"})
+    value_counts = get_observed_value_counts(series)
+
+    return get_pv_pcts_from_counts(value_counts, observed_data_type)
+
+
+def get_pv_pcts_from_counts(value_counts, observed_data_type):
+    """
+    Computes the percentages of each permissible value for a 'NumberList' or 'StringList' variable from its value counts
+
+    Parameters:
+        value_counts (pandas.Series): The counts of each non-missing value, indexed by value
+            in order of first appearance
+        observed_data_type (str): The observed data type of the variable
+
+    Returns:
+        str: A string representation of a list of dictionaries containing permissible value percentages
+    """
+
+    length = value_counts.sum()
+
+    # Order by count, breaking ties by first appearance
+    props = value_counts.sort_values(ascending = False, kind = "stable") / length
+
+    pcts = pd.DataFrame({
+        "value" : props.index,
+        "pct" : [f'{round(100 * x , 2)}%' for x in props]
+    })
     if observed_data_type == "NumberList":
         pcts['value'] = pcts['value'].astype(int)
-    
+
     pcts = pcts.to_dict(orient = "records")
     pcts = str(pcts)
-    
+
     return pcts
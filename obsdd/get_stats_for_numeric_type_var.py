@@ -2,6 +2,8 @@ import numpy as np
 from sklearn.cluster import DBSCAN
 from sklearn.preprocessing import StandardScaler
 
+from obsdd.get_common_summary_stats import get_observed_value_counts
+
 def get_stats_for_numeric_type_var(series):
     """
     Calculates various statistics for a numeric type variable.
@@ -41,17 +43,111 @@ def get_potential_anomalies(series):
     Returns:
         list: A list of potential anomalies (outliers) in the variable.
     """
+    # Run on the distinct values, weighted by how often each was observed
+    value_counts = get_observed_value_counts(series)
+
+    return get_potential_anomalies_from_counts(value_counts)
+
+
+def get_stats_for_numeric_type_var_from_counts(value_counts, sum_of_values = None):
+    """
+    Calculates various statistics for a numeric type variable from its value counts.
+
+    Args:
+        value_counts (pandas.Series): The counts of each non-missing value, indexed by value.
+        sum_of_values (float, optional): The sum of the values as series.sum() computes it.
+            If given, the mean is computed from it so that it rounds as series.mean() does.
+
+    Returns:
+        dict: A dictionary of various statistics for a numeric type variable.
+    """
+    value_counts = value_counts.sort_index()
+    values = value_counts.index.to_numpy()
+    counts = value_counts.to_numpy()
+
+    if sum_of_values is None:
+        mean = np.average(values, weights = counts)
+
+    else:
+        mean = sum_of_values / counts.sum()
+    median = get_quantile_from_counts(value_counts, 0.5)
+
+    stats_for_numeric_var = {}
+
+    stats_for_numeric_var['max'] = values[-1]
+    stats_for_numeric_var['min'] = values[0]
+    stats_for_numeric_var['mean'] = round(mean, 2)
+    stats_for_numeric_var['median'] = round(median, 2)
+    stats_for_numeric_var['potential_anomalies'] = get_potential_anomalies_from_counts(value_counts)
+
+    quantiles = [0.05, 0.1, 0.25, 0.5, 0.75, 0.9, 0.95]
+
+    for q in quantiles:
+        stats_for_numeric_var[f'percentile_{round(100*q)}'] = round(get_quantile_from_counts(value_counts, q), 2)
+
+    return stats_for_numeric_var
+
+
+def get_quantile_from_counts(value_counts, q):
+    """
+    Computes a quantile from value counts, interpolating linearly with numpy's formula as series.quantile does.
+
+    Args:
+        value_counts (pandas.Series): The counts of each non-missing value, indexed by value.
+        q (float): The quantile to compute, between 0 and 1.
+
+    Returns:
+        float: The q-th quantile of the values, each repeated by its count.
+    """
+    value_counts = value_counts.sort_index()
+    values = value_counts.index.to_numpy()
+    cumulative_counts = np.cumsum(value_counts.to_numpy())
+
+    # Position of the quantile among the sorted observations
+    number_of_observations = cumulative_counts[-1]
+    position = (number_of_observations - 1) * q
+    lower = int(np.floor(position))
+    upper = min(lower + 1, number_of_observations - 1)
+    gamma = position - lower
+
+    # The observation at position k is the first value whose cumulative count exceeds k
+    lower_value = values[np.searchsorted(cumulative_counts, lower, side = 'right')]
+    upper_value = values[np.searchsorted(cumulative_counts, upper, side = 'right')]
+
+    # Interpolate from the nearer observation, as numpy does
+    difference = upper_value - lower_value
+
+    if gamma >= 0.5:
+        return upper_value - difference * (1 - gamma)
+
+    return lower_value + difference * gamma
+
+def get_potential_anomalies_from_counts(value_counts):
+    """
+    Uses DBSCAN algorithm to identify potential anomalies from the value counts of a variable.
+
+    Args:
+        value_counts (pandas.Series): The counts of each non-missing value, indexed by value.
+
+    Returns:
+        list: A list of potential anomalies (outliers), each repeated by its count.
+
+    Notes:
+        The counts are passed to DBSCAN as sample weights, so a value is a core point
+        exactly when it would be with every observation clustered individually.
+    """
     # Prepare data for algorithm
-    X_raw = series.dropna()        
-    X = np.array(X_raw).reshape(-1,1)
-    X = StandardScaler().fit_transform(X)
+    values = value_counts.index.to_numpy()
+    counts = value_counts.to_numpy()
+    X = values.reshape(-1,1)
+    X = StandardScaler().fit_transform(X, sample_weight = counts)
 
-    # Instantiate the dbscan and fit X 
-    db = DBSCAN(eps=0.8, min_samples=10).fit(X)
+    # Instantiate the dbscan and fit X
+    db = DBSCAN(eps=0.8, min_samples=10).fit(X, sample_weight = counts)
 
     # The potential anomalies are observations with a label of -1
     labels = db.labels_
-    potential_anomalies = list(X_raw[labels == -1])
+    potential_anomalies = np.repeat(values[labels == -1], counts[labels == -1]).tolist()
 
     # Help with presentation
     potential_anomalies = [round(po, 4) for po in potential_anomalies]
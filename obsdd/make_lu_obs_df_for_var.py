@@ -1,3 +1,6 @@
+import pandas as pd
+
+from obsdd.get_common_summary_stats import get_observed_value_counts
 from obsdd.get_observed_data_type import every_value_is_an_integer
 
 def make_lu_obs_df_for_var(series):
@@ -11,26 +14,36 @@ def make_lu_obs_df_for_var(series):
     - Pandas DataFrame object containing a lookup table of observed values and their counts.
     """
 
-    total = series.shape[0]
-    total_non_missing = series.dropna().shape[0]
+    value_counts = get_observed_value_counts(series)
 
-    # Get value counts
-    value_counts = series.value_counts()
-    value_counts_with_index = value_counts.reset_index()
-    vc = value_counts_with_index
+    return make_lu_obs_df_for_var_from_counts(series.name, value_counts, series.shape[0])
 
-    # Rename columns and add percentage columns
-    vc = vc.rename(columns = {"index" : "var_value", series.name : "value_count"}) 
-    vc['val_pct_keep_missing_in_total'] = vc['value_count'].apply(lambda x: f'{round(100 * x/total, 2)}%')
-    vc['val_pct_drop_missing_in_total'] = vc['value_count'].apply(lambda x: f'{round(100 * x/total_non_missing, 2)}%')
 
-    # Add the variable name
-    vc['var_name'] = series.name
+def make_lu_obs_df_for_var_from_counts(var_name, value_counts, total):
+    """
+    Returns the lookup table of make_lu_obs_df_for_var built from the value counts of a variable.
+
+    Args:
+    - var_name: Name of the variable
+    - value_counts: Pandas Series of the counts of each non-missing value, indexed by value
+    - total: The total number of rows, including missing values
+
+    Returns:
+    - Pandas DataFrame object containing a lookup table of observed values and their counts.
+    """
+
+    total_non_missing = value_counts.sum()
 
-    # Rearrange column order
-    new_col_order = ['var_name']
-    new_col_order += [c for c in vc.columns if c not in new_col_order]
-    vc = vc[new_col_order]
+    # Order by count, breaking ties by first appearance
+    value_counts = value_counts.sort_values(ascending = False, kind = "stable")
+
+    vc = pd.DataFrame({
+        "var_name" : var_name,
+        "var_value" : value_counts.index,
+        "value_count" : value_counts.to_numpy()
+    })
+    vc['val_pct_keep_missing_in_total'] = vc['value_count'].apply(lambda x: f'{round(100 * x/total, 2)}%')
+    vc['val_pct_drop_missing_in_total'] = vc['value_count'].apply(lambda x: f'{round(100 * x/total_non_missing, 2)}%')
 
     # If the 'var_value' count is full of integers, then convert to integer
     if every_value_is_an_integer(vc['var_value']):
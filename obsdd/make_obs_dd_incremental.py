@@ -0,0 +1,330 @@
+import pandas as pd
+
+from obsdd.date_helpers import (
+    string_series_is_series_of_blsa_dates,
+    string_series_is_series_of_extended_blsa_dates,
+    string_series_is_series_of_td_dates
+)
+from obsdd.get_common_summary_stats import (
+    get_common_summary_stats_from_counts,
+    get_number_of_distinct_values_from_counts,
+    get_observed_value_counts
+)
+from obsdd.get_observed_data_type import (
+    classified_as_numeric_by_pandas,
+    classify_observed_data_type,
+    every_value_is_an_integer
+)
+from obsdd.get_stats_for_list_type_var import get_stats_for_list_type_var_from_counts
+from obsdd.get_stats_for_numeric_type_var import get_stats_for_numeric_type_var_from_counts
+from obsdd.make_lu_obs_df_for_var import make_lu_obs_df_for_var_from_counts
+
+
+def make_obs_dd_incremental(df, state = None, watermark_col = None):
+    """
+    Generate an ObsDD of an append-only DataFrame, processing only the rows added since the last run.
+
+    Args:
+    df: pandas DataFrame containing the full table to be described.
+    state: The state returned by the previous call, or None to profile every row.
+    watermark_col: Optional name of a column that never decreases as rows are appended,
+        such as an ID or a timestamp. It must not contain missing values. If given, rows
+        with a value above the previous maximum, and rows tying it beyond those already
+        seen, are treated as new. Otherwise, rows past the previous row count are treated as new.
+
+    Returns:
+    obs_dd: pandas DataFrame containing the ObsDD.
+    lu_obs: pandas DataFrame containing the Look-Up (LU) Observations.
+    state: dict to pass to the next call. It holds the watermark and the per-column
+        accumulators, and can be pickled to persist it between sessions.
+
+    Notes:
+    The accumulators keep the count of each distinct value, so the cost of a refresh
+    depends on the number of new rows and distinct values rather than on the size of the table.
+    """
+
+    if watermark_col is not None and df[watermark_col].isna().any():
+        raise ValueError(f"watermark_col {watermark_col!r} must not contain missing values")
+
+    if state is None:
+        state = {'watermark_col' : watermark_col, 'watermark' : None, 'rows_at_watermark' : 0, 'accumulators' : {}}
+
+    else:
+        check_state_matches_df(df, state, watermark_col)
+
+    delta, new_watermark, rows_at_new_watermark = select_rows_past_watermark(df, state, watermark_col)
+
+    accumulators = {}
+
+    for col_name in list(df.columns):
+        accumulator = make_accumulator_for_series(delta[col_name])
+
+        if col_name in state['accumulators']:
+            accumulator = merge_accumulators(state['accumulators'][col_name], accumulator)
+
+        accumulators[col_name] = accumulator
+
+    obs_dd, lu_obs = make_obs_dd_from_accumulators(accumulators)
+
+    new_state = {
+        'watermark_col' : watermark_col,
+        'watermark' : new_watermark,
+        'rows_at_watermark' : rows_at_new_watermark,
+        'accumulators' : accumulators
+    }
+
+    return obs_dd, lu_obs, new_state
+
+
+def check_state_matches_df(df, state, watermark_col):
+    """
+    Raise a ValueError if the state from a previous run cannot be updated with df.
+
+    Args:
+    df: pandas DataFrame containing the full table to be described.
+    state: The state returned by the previous call to make_obs_dd_incremental.
+    watermark_col: The watermark column passed to the current call.
+    """
+
+    if state['watermark_col'] != watermark_col:
+        raise ValueError(
+            f"watermark_col {watermark_col!r} does not match the {state['watermark_col']!r} "
+            "used to build the state"
+        )
+
+    if set(df.columns) != set(state['accumulators']):
+        raise ValueError("The columns of df do not match the state; re-profile with state=None")
+
+    if watermark_col is None and df.shape[0] < state['watermark']:
+        raise ValueError(
+            f"df has {df.shape[0]} rows but the state was built from {state['watermark']}; "
+            "re-profile with state=None"
+        )
+
+    if watermark_col is not None and state['watermark'] is not None and df[watermark_col].max() < state['watermark']:
+        raise ValueError(
+            f"The largest {watermark_col!r} in df is below the watermark {state['watermark']!r}; "
+            "re-profile with state=None"
+        )
+
+
+def select_rows_past_watermark(df, state, watermark_col):
+    """
+    Select the rows of df that were not processed by the previous run.
+
+    Args:
+    df: pandas DataFrame containing the full table to be described.
+    state: The state returned by the previous call to make_obs_dd_incremental.
+    watermark_col: Optional name of the watermark column.
+
+    Returns:
+    delta: pandas DataFrame containing the new rows.
+    new_watermark: The row count, or the largest value of watermark_col, of df.
+    rows_at_new_watermark: The number of rows of df whose watermark_col equals new_watermark.
+    """
+
+    watermark = state['watermark']
+
+    if watermark_col is None:
+        delta = df if watermark is None else df.iloc[watermark:]
+
+        return delta, df.shape[0], None
+
+    keys = df[watermark_col]
+
+    if keys.shape[0] == 0:
+        return df, watermark, state['rows_at_watermark']
+
+    if watermark is None:
+        delta = df
+
+    else:
+        # Rows tying the watermark may have been appended since, so skip only those already seen
+        at_watermark = keys == watermark
+        already_seen = at_watermark & (at_watermark.cumsum() <= state['rows_at_watermark'])
+        delta = df[(keys >= watermark) & ~already_seen]
+
+    new_watermark = keys.max()
+    rows_at_new_watermark = int((keys == new_watermark).sum())
+
+    return delta, new_watermark, rows_at_new_watermark
+
+
+def make_accumulator_for_series(series):
+    """
+    Summarize a pandas Series into an accumulator that can be merged with later rows.
+
+    Args:
+    series: pandas Series containing the rows to summarize.
+
+    Returns:
+    dict: The dtype, number of rows, value counts and (if numeric) sum of the Series,
+        along with whether all of its values are integers or match each recognized date format.
+    """
+
+    # Every check below only depends on the distinct values
+    value_counts = get_observed_value_counts(series)
+    unique_values = pd.Series(value_counts.index, dtype = series.dtype)
+
+    # Numbers never match a date format, so only the string checks need running
+    if classified_as_numeric_by_pandas(series):
+        no_values = unique_values.shape[0] == 0
+        all_blsa_dates = all_extended_blsa_dates = all_td_dates = no_values
+
+    else:
+        all_blsa_dates = bool(string_series_is_series_of_blsa_dates(unique_values))
+        all_extended_blsa_dates = bool(string_series_is_series_of_extended_blsa_dates(unique_values))
+        all_td_dates = bool(string_series_is_series_of_td_dates(unique_values))
+
+    accumulator = {}
+    accumulator['dtype'] = str(series.dtype)
+    accumulator['number_of_rows'] = series.shape[0]
+    accumulator['value_counts'] = value_counts
+    accumulator['sum_of_values'] = series.sum() if classified_as_numeric_by_pandas(series) else None
+    accumulator['all_integers'] = every_value_is_an_integer(unique_values)
+    accumulator['all_blsa_dates'] = all_blsa_dates
+    accumulator['all_extended_blsa_dates'] = all_extended_blsa_dates
+    accumulator['all_td_dates'] = all_td_dates
+
+    return accumulator
+
+
+def merge_accumulators(old, new):
+    """
+    Combine the accumulator of the previous rows with the accumulator of the new rows.
+
+    Args:
+    old: dict returned by make_accumulator_for_series for the previous rows.
+    new: dict returned by make_accumulator_for_series for the new rows.
+
+    Returns:
+    dict: The accumulator of all rows.
+    """
+
+    # New values are appended so that the index stays in order of first appearance
+    index = old['value_counts'].index.append(
+        new['value_counts'].index.difference(old['value_counts'].index, sort = False)
+    )
+    value_counts = (
+        old['value_counts'].reindex(index, fill_value = 0) +
+        new['value_counts'].reindex(index, fill_value = 0)
+    )
+
+    accumulator = {}
+    accumulator['dtype'] = merge_dtypes(old['dtype'], new['dtype'])
+    accumulator['number_of_rows'] = old['number_of_rows'] + new['number_of_rows']
+    accumulator['value_counts'] = value_counts
+    accumulator['sum_of_values'] = merge_sums_of_values(old['sum_of_values'], new['sum_of_values'])
+    accumulator['all_integers'] = old['all_integers'] and new['all_integers']
+    accumulator['all_blsa_dates'] = old['all_blsa_dates'] and new['all_blsa_dates']
+    accumulator['all_extended_blsa_dates'] = old['all_extended_blsa_dates'] and new['all_extended_blsa_dates']
+    accumulator['all_td_dates'] = old['all_td_dates'] and new['all_td_dates']
+
+    return accumulator
+
+
+def merge_sums_of_values(old_sum, new_sum):
+    """
+    Add the sums of the values of the previous and new rows.
+
+    Args:
+    old_sum: The sum of the previous rows, or None if they were not numeric.
+    new_sum: The sum of the new rows, or None if they were not numeric.
+
+    Returns:
+    The sum of all rows, or None if any of them were not numeric.
+    """
+
+    if old_sum is None or new_sum is None:
+        return None
+
+    return old_sum + new_sum
+
+
+def merge_dtypes(old_dtype, new_dtype):
+    """
+    Get the dtype pandas would give a column made of rows with the two dtypes.
+
+    Args:
+    old_dtype: str of the dtype of the previous rows.
+    new_dtype: str of the dtype of the new rows.
+
+    Returns:
+    str: 'float64' when mixing int64 and float64, 'object' for any other mix.
+    """
+
+    if old_dtype == new_dtype:
+        return old_dtype
+
+    elif {old_dtype, new_dtype} == {'int64', 'float64'}:
+        return 'float64'
+
+    else:
+        return 'object'
+
+
+def make_obs_dd_from_accumulators(accumulators):
+    """
+    Generate the ObsDD and LU Observations from the accumulators of each column.
+
+    Args:
+    accumulators: dict mapping each column name to its accumulator.
+
+    Returns:
+    obs_dd: pandas DataFrame containing the ObsDD.
+    lu_obs: pandas DataFrame containing the Look-Up (LU) Observations.
+    """
+
+    obs_dd_records = []
+    lu_obs_dfs = []
+
+    for col_name, accumulator in accumulators.items():
+
+        value_counts = accumulator['value_counts']
+        number_of_rows = accumulator['number_of_rows']
+        number_of_distinct_values = get_number_of_distinct_values_from_counts(value_counts, number_of_rows)
+
+        # Reclassify the column from everything seen so far
+        observed_data_type = classify_observed_data_type(
+            dtype=accumulator['dtype'],
+            values_are_dates=(
+                accumulator['all_blsa_dates'] or
+                accumulator['all_extended_blsa_dates'] or
+                accumulator['all_td_dates']
+            ),
+            all_integers=accumulator['all_integers'],
+            number_of_unique_values=number_of_distinct_values
+        )
+
+        summary_stats = {}
+        summary_stats['var_name'] = col_name
+
+        common_summary_stats = get_common_summary_stats_from_counts(value_counts, number_of_rows, observed_data_type)
+        summary_stats.update(common_summary_stats)
+
+        if observed_data_type in ['NumberList', 'StringList']:
+            stats_for_list_type_var = get_stats_for_list_type_var_from_counts(value_counts, observed_data_type)
+            summary_stats.update(stats_for_list_type_var)
+
+            # Make Look-Up (LU) Observations for variable
+            lu_obs_for_var = make_lu_obs_df_for_var_from_counts(col_name, value_counts, number_of_rows)
+            lu_obs_dfs.append(lu_obs_for_var)
+
+        if observed_data_type in ['Integer', 'Decimal']:
+            stats_for_numeric_var = get_stats_for_numeric_type_var_from_counts(value_counts, accumulator['sum_of_values'])
+            summary_stats.update(stats_for_numeric_var)
+
+        obs_dd_records.append(summary_stats)
+
+    # Combine all ObsDD records into a single DataFrame
+    obs_dd = pd.DataFrame(obs_dd_records)
+
+    # Combine all Look-Up (LU) Observations into a single DataFrame
+    if len(lu_obs_dfs) > 0:
+      lu_obs = pd.concat(lu_obs_dfs)
+      lu_obs = lu_obs.reset_index(drop = True)
+
+    else:
+      lu_obs = pd.DataFrame()
+
+    return obs_dd, lu_obs
@@ -0,0 +1,108 @@
+import pickle
+
+import numpy as np
+import pandas as pd
+import pytest
+from pandas.api.types import CategoricalDtype
+
+import obsdd
+
+
+def refresh_in_two_steps(first_df, full_df, watermark_col = None):
+    """
+    Profile first_df, persist the state through pickle, then refresh with full_df.
+    """
+    _, _, state = obsdd.make_obs_dd_incremental(first_df, watermark_col = watermark_col)
+    state = pickle.loads(pickle.dumps(state))
+
+    return obsdd.make_obs_dd_incremental(full_df, state, watermark_col = watermark_col)
+
+
+def assert_matches_full_run(obs_dd, lu_obs, full_df):
+    expected_obs_dd, expected_lu_obs = obsdd.make_obs_dd(full_df)
+
+    pd.testing.assert_frame_equal(obs_dd, expected_obs_dd)
+    pd.testing.assert_frame_equal(lu_obs, expected_lu_obs)
+
+
+def test_row_count_watermark():
+    rng = np.random.default_rng(0)
+    n = 200
+    full_df = pd.DataFrame({
+        'visit' : rng.choice(5, n),
+        'weight_kg' : np.round(rng.normal(80, 10, n), 1),
+        'sex' : pd.Series(rng.choice(['F', 'M', None], n), dtype = object),
+        'visit_date' : pd.Series([f'2020-01-{i % 28 + 1:02d}' for i in range(n)], dtype = object)
+    })
+
+    obs_dd, lu_obs, state = refresh_in_two_steps(full_df.iloc[:80], full_df)
+
+    assert_matches_full_run(obs_dd, lu_obs, full_df)
+    assert state['watermark'] == n
+
+
+def test_key_watermark_with_tied_keys():
+    first_df = pd.DataFrame({'t' : [1, 2, 2], 'v' : [10, 20, 30]})
+    full_df = pd.concat([first_df, pd.DataFrame({'t' : [2, 3], 'v' : [40, 50]})], ignore_index = True)
+
+    obs_dd, lu_obs, _ = refresh_in_two_steps(first_df, full_df, watermark_col = 't')
+
+    assert_matches_full_run(obs_dd, lu_obs, full_df)
+    assert list(obs_dd['number_of_observed_values']) == [5, 5]
+
+
+def test_refresh_without_new_rows_adds_nothing():
+    full_df = pd.DataFrame({'t' : [1, 2, 2], 'v' : [10, 20, 30]})
+
+    _, _, state = obsdd.make_obs_dd_incremental(full_df, watermark_col = 't')
+    obs_dd, lu_obs, _ = obsdd.make_obs_dd_incremental(full_df, state, watermark_col = 't')
+
+    assert_matches_full_run(obs_dd, lu_obs, full_df)
+
+
+def test_number_list_crossing_cardinality_threshold():
+    first_df = pd.DataFrame({'x' : [1, 2, 3] * 10})
+    full_df = pd.concat([first_df, pd.DataFrame({'x' : range(100, 120)})], ignore_index = True)
+
+    first_obs_dd, _, _ = obsdd.make_obs_dd_incremental(first_df)
+    obs_dd, lu_obs, _ = refresh_in_two_steps(first_df, full_df)
+
+    assert first_obs_dd['observed_data_type'][0] == 'NumberList'
+    assert obs_dd['observed_data_type'][0] == 'String'
+    assert_matches_full_run(obs_dd, lu_obs, full_df)
+
+
+@pytest.mark.parametrize('appended', [
+    pd.Series([np.nan, 4.5]),
+    pd.Series(['a', 'b'], dtype = object),
+])
+def test_dtype_change(appended):
+    first_df = pd.DataFrame({'x' : [1, 2, 3] * 5})
+    full_df = pd.concat([first_df, appended.to_frame('x')], ignore_index = True)
+
+    obs_dd, lu_obs, _ = refresh_in_two_steps(first_df, full_df)
+
+    assert_matches_full_run(obs_dd, lu_obs, full_df)
+
+
+def test_unobserved_categories_are_not_counted():
+    series = pd.Series(['a', 'a', None], dtype = CategoricalDtype(['a', 'b', 'c']))
+
+    obs_dd, _ = obsdd.make_obs_dd(series.to_frame('c'))
+
+    assert obs_dd['number_of_distinct_values'][0] == 2
+
+
+def test_missing_key_is_rejected():
+    df = pd.DataFrame({'t' : [1.0, np.nan]})
+
+    with pytest.raises(ValueError):
+        obsdd.make_obs_dd_incremental(df, watermark_col = 't')
+
+
+def test_shrunk_table_is_rejected():
+    df = pd.DataFrame({'x' : [1, 2, 3]})
+    _, _, state = obsdd.make_obs_dd_incremental(df)
+
+    with pytest.raises(ValueError):
+        obsdd.make_obs_dd_incremental(df.iloc[:2], state)